@@ -1,24 +1,24 @@
 import fitz
 import docx
 import os
+import logging
+
+logger = logging.getLogger(__name__)
 
 def extract_text_from_pdf(pdf_path):
     if not os.path.exists(pdf_path):
         raise FileNotFoundError(f"File not found: {pdf_path}")
 
-    text = ""
     try:
-        doc = fitz.open(pdf_path)
-        for page in doc:
-            extracted_text = page.get_text("text")
-            if extracted_text.strip():
-                text += extracted_text + "\n"
+        with fitz.open(pdf_path) as doc:
+            pages = [page.get_text("text") for page in doc]
+        text = "\n".join(page for page in pages if page.strip())
     except Exception as e:
-        print(f"Error reading PDF {pdf_path}: {e}")
+        logger.error("Error reading PDF %s: %s", pdf_path, e)
         return ""
 
     if not text.strip():
-        print(f"Warning: No text found in {pdf_path}. Consider OCR for scanned PDFs.")
+        logger.warning("No text found in %s. Consider OCR for scanned PDFs.", pdf_path)
     
     return text.strip()
 
@@ -26,13 +26,11 @@ def extract_text_from_docx(docx_path):
     if not os.path.exists(docx_path):
         raise FileNotFoundError(f"File not found: {docx_path}")
 
-    text = ""
     try:
         doc = docx.Document(docx_path)
-        for para in doc.paragraphs:
-            text += para.text + "\n"
+        text = "\n".join(para.text for para in doc.paragraphs)
     except Exception as e:
-        print(f"Error reading DOCX {docx_path}: {e}")
+        logger.error("Error reading DOCX %s: %s", docx_path, e)
         return ""
 
     return text.strip()
@@ -1,13 +1,85 @@
-import pycountry
 import re
+import threading
+from collections import OrderedDict
 from geopy.geocoders import Nominatim
-from geopy.distance import geodesic
-import math
-from backend.utils.spacy_model import nlp  
+from geopy.extra.rate_limiter import RateLimiter
+import numpy as np
+from functools import lru_cache
+from backend.utils.spacy_model import get_nlp
 
 geolocator = Nominatim(user_agent="cv_analyzer")
+# Nominatim allows 1 request/s; the limiter spaces requests across all threads
+# and lets errors raise instead of turning them into "not found".
+_rate_limited_geocode = RateLimiter(geolocator.geocode, min_delay_seconds=1, swallow_exceptions=False)
+
+LOCATION_LINE_RE = re.compile(r"^[A-Za-z\s]+,\s*[A-Za-z\s]+$", re.MULTILINE)
+
+def _normalize(location):
+    return location.strip().lower()
+
+# Every lookup goes through this cache. Failed requests raise and are
+# therefore never cached.
+GEOCODE_CACHE_SIZE = 10000
+_geocode_cache = OrderedDict()
+_geocode_cache_lock = threading.Lock()
+
+class GeocodeCacheMiss(Exception):
+    """A cache-only lookup needed a query that has not been geocoded yet."""
+
+class LocationLookupError(Exception):
+    """A geocoding request failed, so no reliable location could be determined."""
+
+def _geocode(query, cached_only=False):
+    with _geocode_cache_lock:
+        if query in _geocode_cache:
+            _geocode_cache.move_to_end(query)
+            return _geocode_cache[query]
+    if cached_only:
+        raise GeocodeCacheMiss(query)
+
+    result = _rate_limited_geocode(query, timeout=10)
+    with _geocode_cache_lock:
+        _geocode_cache[query] = result
+        while len(_geocode_cache) > GEOCODE_CACHE_SIZE:
+            _geocode_cache.popitem(last=False)
+    return result
+
+@lru_cache(maxsize=1000)
+def _is_country(name):
+    import pycountry
 
-def is_valid_location(location):
+    try:
+        pycountry.countries.search_fuzzy(name)
+        return True
+    except LookupError:
+        return False
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km; accepts scalars or NumPy arrays."""
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * 6371.0 * np.arcsin(np.sqrt(a))
+
+def _distance_score(distance):
+    return np.round(np.where(distance > 100, 100 * np.exp(-0.0006 * (distance - 100)), 100), 2)
+
+@lru_cache(maxsize=10000)
+def _distance_km(cv_location, job_location):
+    cv_loc = _geocode(cv_location)
+    job_loc = _geocode(job_location)
+    if cv_loc and job_loc:
+        return float(haversine_km(cv_loc.latitude, cv_loc.longitude, job_loc.latitude, job_loc.longitude))
+    return None
+
+def _fallback_score(cv_location, job_location):
+    cv_parts = cv_location.lower().split(',')
+    job_parts = job_location.lower().split(',')
+
+    if cv_parts[-1].strip() == job_parts[-1].strip():
+        return 70
+    return 30
+
+def is_valid_location(location, cached_only=False):
     parts = [p.strip() for p in location.split(',')]
 
     if len(parts) == 2:
@@ -17,42 +89,37 @@ def is_valid_location(location):
     else:
         return False
 
-    if country:
-        try:
-            pycountry.countries.search_fuzzy(country)[0]
-        except LookupError:
-            return False
+    if country and not _is_country(_normalize(country)):
+        return False
 
     try:
-        city_location = geolocator.geocode(city, timeout=5)
+        city_location = _geocode(_normalize(city), cached_only)
         if city_location:
             return True
-    except Exception:
-        return False
+    except GeocodeCacheMiss:
+        raise
+    except Exception as e:
+        raise LocationLookupError(location) from e
 
     return False
 
-def extract_location(text):
-    doc = nlp(text)
-
-    locations = [ent.text for ent in doc.ents if ent.label_ == "GPE"]
+def extract_location(text, doc=None, cached_only=False):
+    """
+    Find the candidate's location, or "" if none is found.
 
-    location_patterns = [
-        r"^[A-Za-z\s]+,\s*[A-Za-z\s]+$",
-    ]
+    Raises LocationLookupError if a geocoding request fails, and with cached_only,
+    GeocodeCacheMiss rather than making a request.
+    """
+    if doc is None:
+        doc = get_nlp()(text)
 
-    for pattern in location_patterns:
-        matches = re.finditer(pattern, text, re.MULTILINE)
-        for match in matches:
-            try:
-                location = match.group(0).strip()
-                if location:
-                    locations.insert(0, location)
-            except (IndexError, AttributeError):
-                continue
+    # "City, Country" lines are tried first, latest line first, then GPE entities.
+    line_locations = [match.group(0).strip() for match in LOCATION_LINE_RE.finditer(text)]
+    locations = [loc for loc in reversed(line_locations) if loc]
+    locations.extend(ent.text for ent in doc.ents if ent.label_ == "GPE")
 
     for loc in locations:
-        if is_valid_location(loc):
+        if is_valid_location(loc, cached_only):
             return loc
 
     return ""
@@ -62,19 +129,52 @@ def compute_location_score(cv_location, job_location):
         return 0
 
     try:
-        cv_loc = geolocator.geocode(cv_location, timeout=10)
-        job_loc = geolocator.geocode(job_location, timeout=10)
+        distance = _distance_km(_normalize(cv_location), _normalize(job_location))
 
-        if cv_loc and job_loc:
-            distance = geodesic((cv_loc.latitude, cv_loc.longitude), (job_loc.latitude, job_loc.longitude)).km
-
-            return round(100 * math.exp(-0.0006 * (distance - 100)) if distance > 100 else 100,2)
+        if distance is not None:
+            return float(_distance_score(distance))
     except Exception:
-        cv_parts = cv_location.lower().split(',')
-        job_parts = job_location.lower().split(',')
+        return _fallback_score(cv_location, job_location)
+
+    return 0
 
-        if cv_parts[-1].strip() == job_parts[-1].strip():
-            return 70
-        return 30
+def compute_location_scores(cv_locations, job_location):
+    """
+    Score many candidate locations against one job, computing all distances in one pass.
 
-    return 0
\ No newline at end of file
+    Returns (scores, failed), where failed[i] marks a score that fell back because
+    a geocoding request failed.
+    """
+    scores = [0] * len(cv_locations)
+    failed = [False] * len(cv_locations)
+    if not job_location:
+        return scores, failed
+
+    try:
+        job_loc = _geocode(_normalize(job_location))
+    except Exception:
+        return [_fallback_score(loc, job_location) if loc else 0 for loc in cv_locations], [bool(loc) for loc in cv_locations]
+    if not job_loc:
+        return scores, failed
+
+    indices, coords = [], []
+    for i, cv_location in enumerate(cv_locations):
+        if not cv_location:
+            continue
+        try:
+            cv_loc = _geocode(_normalize(cv_location))
+        except Exception:
+            scores[i] = _fallback_score(cv_location, job_location)
+            failed[i] = True
+            continue
+        if cv_loc:
+            indices.append(i)
+            coords.append((cv_loc.latitude, cv_loc.longitude))
+
+    if coords:
+        coords = np.array(coords)
+        distances = haversine_km(coords[:, 0], coords[:, 1], job_loc.latitude, job_loc.longitude)
+        for i, score in zip(indices, _distance_score(distances)):
+            scores[i] = float(score)
+
+    return scores, failed
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, JSON, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -14,3 +14,13 @@ class Resume(Base):
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
     file_path = Column(String, nullable=False)
+    file_hash = Column(String(40), index=True)
+
+class ScoreCache(Base):
+    __tablename__ = "score_cache"
+    __table_args__ = (UniqueConstraint("resume_hash", "job_hash", "model_version"),)
+    id = Column(Integer, primary_key=True, index=True)
+    resume_hash = Column(String(40), nullable=False)
+    job_hash = Column(String(40), nullable=False)
+    model_version = Column(String, nullable=False)
+    scores = Column(JSON, nullable=False)
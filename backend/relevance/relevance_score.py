@@ -1,15 +1,63 @@
-import torch
-from sklearn.metrics.pairwise import cosine_similarity
-from backend.utils.bert_model import tokenizer, model
+import threading
+from collections import OrderedDict
+from backend.utils.bert_model import get_bert
+from backend.utils.cache_key import text_cache_key
 
-def compute_similarity_bert(cv_text, job_description):
-    def get_embedding(text):
-        inputs = tokenizer(text, return_tensors="pt", padding=True, truncation=True, max_length=512)
-        with torch.no_grad():
+# Endpoints run in FastAPI's threadpool; cap how many BERT forward passes run
+# at once so concurrent requests don't oversubscribe the CPU.
+BERT_MAX_CONCURRENCY = 4
+_inference_slots = threading.BoundedSemaphore(BERT_MAX_CONCURRENCY)
+
+# Resume embeddings keyed on a hash of the text, so unchanged resumes skip BERT
+# on repeat recommendation requests.
+EMBEDDING_CACHE_SIZE = 1024
+_embedding_cache = OrderedDict()
+_embedding_cache_lock = threading.Lock()
+
+def embed_texts(texts, batch_size=16):
+    import torch
+
+    tokenizer, model = get_bert()
+    keys = [text_cache_key(text) for text in texts]
+    with _embedding_cache_lock:
+        found = {key: _embedding_cache[key] for key in keys if key in _embedding_cache}
+    missing = list({key: text for key, text in zip(keys, texts) if key not in found}.items())
+
+    # Padding tokens are masked out of the mean so batched and single-text
+    # embeddings agree.
+    for i in range(0, len(missing), batch_size):
+        batch = missing[i:i + batch_size]
+        inputs = tokenizer([text for _, text in batch], return_tensors="pt", padding=True, truncation=True, max_length=512)
+        inputs = inputs.to(model.device)
+        with _inference_slots, torch.inference_mode():
             outputs = model(**inputs)
-        return outputs.last_hidden_state.mean(dim=1).numpy()
-    
-    cv_embedding = get_embedding(cv_text)
-    job_embedding = get_embedding(job_description)
-    similarity = cosine_similarity(cv_embedding, job_embedding)[0][0] * 100
-    return round(similarity, 2)
\ No newline at end of file
+        # Pool in fp32 and keep cached embeddings on the CPU, whatever the model runs on.
+        hidden = outputs.last_hidden_state.float()
+        mask = inputs["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+        embeddings = ((hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)).cpu()
+        for (key, _), embedding in zip(batch, embeddings):
+            found[key] = embedding
+
+    with _embedding_cache_lock:
+        for key in keys:
+            _embedding_cache.pop(key, None)
+            _embedding_cache[key] = found[key]
+        while len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+            _embedding_cache.popitem(last=False)
+
+    return torch.stack([found[key] for key in keys])
+
+def compute_similarity_bert(cv_text, job_description):
+    return round(compute_similarity_batch([cv_text], job_description)[0], 2)
+
+def compute_similarity_batch(cv_texts, job_description):
+    import torch.nn.functional as F
+
+    if not cv_texts:
+        return []
+    # One embed call so uncached CVs and the job description share forward
+    # passes; unit-normalized embeddings turn cosine similarity into a matmul.
+    embeddings = F.normalize(embed_texts(list(cv_texts) + [job_description]), dim=1)
+    cv_embeddings, job_embedding = embeddings[:-1], embeddings[-1:]
+    similarities = (cv_embeddings @ job_embedding.T).squeeze(1) * 100
+    return similarities.tolist()
@@ -1,4 +1,4 @@
-from .cv_quality import evaluate_cv_quality, CVQualityEvaluator
+from .cv_quality import evaluate_cv_quality, evaluate_cv_quality_batch, CVQualityEvaluator
 from .evaluator_base import ResumeEvaluator
 from .grammar_spelling import GrammarSpellingEvaluator
 from .readability import ReadabilityEvaluator
@@ -9,6 +9,7 @@ from .structure import StructureEvaluator  # Add the new evaluator
 
 __all__ = [
     'evaluate_cv_quality', 
+    'evaluate_cv_quality_batch',
     'CVQualityEvaluator',
     'ResumeEvaluator',
     'GrammarSpellingEvaluator',
@@ -1,10 +1,15 @@
 import re
 import os
+import asyncio
+import sys
 import json
-from collections import defaultdict
+import logging
+from collections import Counter, defaultdict
 from typing import Dict, Any, List, Set, Optional, Tuple
-from .evaluator_base import ResumeEvaluator
-from .config import ACTION_VERB_WEIGHTS
+from .evaluator_base import ResumeEvaluator, load_spacy_model
+from .config import ACTION_VERB_WEIGHTS, ACTION_VERB_SPACY_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
 
 # Add SpaCy for NLP-based analysis
 try:
@@ -13,28 +18,43 @@ try:
 except ImportError:
     SPACY_AVAILABLE = False
 
+_BULLET_PREFIX_RE = re.compile(r'^\s*[•\-*>]?\s*')
+_BULLET_SYMBOLS = '•-*>'
+_FIRST_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+
+def _intern_lower(verbs: List[str]) -> frozenset:
+    """Lowercase and intern verbs once, at load time."""
+    return frozenset(sys.intern(verb.lower()) for verb in verbs)
+
 class ActionVerbEvaluator(ResumeEvaluator):
     """Evaluates the use of strong action verbs in resume bullet points."""
     
     DEFAULT_VERBS_PATH = os.path.join(os.path.dirname(__file__), 'data', 'action_verbs.json')
     
     def __init__(self, custom_verbs_path: Optional[str] = None, nlp_model: str = "en_core_web_sm"):
-        # Initialize verb collections
-        self.strong_action_verbs = set()
-        self.domain_specific_verbs = defaultdict(set)
+        # Initialize verb collections (frozen; additions rebind to a new frozenset)
+        self.strong_action_verbs = frozenset()
+        self.domain_specific_verbs = defaultdict(frozenset)
         
         # Word patterns that often indicate the start of a bullet but aren't action verbs
-        self.non_action_starters = {
+        self.non_action_starters = frozenset({
             "responsible", "duties", "working", "helping", "assisting", 
             "supporting", "participating", "attending"
-        }
+        })
         
         # Initialize NLP for contextual analysis
         self.nlp = None
         if SPACY_AVAILABLE:
             try:
-                self.nlp = spacy.load(nlp_model)
+                self.nlp = load_spacy_model(nlp_model)
                 print(f"SpaCy NLP model '{nlp_model}' loaded successfully.")
+                
+                # Integer IDs for the POS/dependency labels compared per token
+                strings = self.nlp.vocab.strings
+                self._verb_pos = strings["VERB"]
+                self._root_dep = strings["ROOT"]
+                self._object_deps = frozenset(strings[dep] for dep in ("dobj", "pobj"))
+                self._quantifier_deps = frozenset(strings[dep] for dep in ("nummod", "quantmod"))
             except Exception as e:
                 print(f"Warning: Could not load SpaCy model '{nlp_model}': {e}")
                 print("Falling back to basic text analysis.")
@@ -86,19 +106,16 @@ class ActionVerbEvaluator(ResumeEvaluator):
             
             # Load general verbs
             if "general" in data and isinstance(data["general"], list):
-                self.strong_action_verbs.update(set(verb.lower() for verb in data["general"]))
+                self.strong_action_verbs |= _intern_lower(data["general"])
             
             # Load domain-specific verbs
             if "domains" in data and isinstance(data["domains"], dict):
                 for domain, verbs in data["domains"].items():
                     if isinstance(verbs, list):
-                        self.domain_specific_verbs[domain.lower()].update(
-                            set(verb.lower() for verb in verbs)
-                        )
+                        domain_verbs = _intern_lower(verbs)
+                        self.domain_specific_verbs[domain.lower()] |= domain_verbs
                         # Also add domain verbs to general set for normal evaluation
-                        self.strong_action_verbs.update(
-                            set(verb.lower() for verb in verbs)
-                        )
+                        self.strong_action_verbs |= domain_verbs
             return True
         except Exception as e:
             print(f"Error loading verbs from {file_path}: {e}")
@@ -112,11 +129,11 @@ class ActionVerbEvaluator(ResumeEvaluator):
             verbs: List of verbs to add
             domain: Optional domain to categorize these verbs
         """
-        lower_verbs = set(verb.lower() for verb in verbs)
-        self.strong_action_verbs.update(lower_verbs)
+        lower_verbs = _intern_lower(verbs)
+        self.strong_action_verbs |= lower_verbs
         
         if domain:
-            self.domain_specific_verbs[domain.lower()].update(lower_verbs)
+            self.domain_specific_verbs[domain.lower()] |= lower_verbs
     
     def get_domain_strength(self, text: str, domain: str) -> Dict[str, Any]:
         """
@@ -137,11 +154,13 @@ class ActionVerbEvaluator(ResumeEvaluator):
         domain_verbs_used = []
         
         for bullet in bullets:
-            cleaned_bullet = re.sub(r'^\s*[•\-*>]?\s*', '', bullet).strip()
-            words = re.findall(r'\b[a-zA-Z]+\b', cleaned_bullet)
+            cleaned_bullet = self._clean_bullet(bullet)
+            match = _FIRST_WORD_RE.search(cleaned_bullet)
             
-            if words and words[0].lower() in self.domain_specific_verbs[domain]:
-                domain_verbs_used.append(words[0].lower())
+            if match:
+                first_word = match.group(0).lower()
+                if first_word in self.domain_specific_verbs[domain]:
+                    domain_verbs_used.append(first_word)
         
         return {
             "domain_match": len(domain_verbs_used) / max(1, len(bullets)) * 100,
@@ -159,74 +178,116 @@ class ActionVerbEvaluator(ResumeEvaluator):
             Dict with verb information and context
         """
         # Clean the bullet text
-        cleaned_text = re.sub(r'^\s*[•\-*>]?\s*', '', text).strip()
+        cleaned_text = self._clean_bullet(text)
         
         if not self.nlp:
-            # Fallback to simple extraction if SpaCy is not available
-            words = re.findall(r'\b[a-zA-Z]+\b', cleaned_text)
-            if not words:
-                return {"has_verb": False}
-                
-            first_word = words[0].lower()
-            return {
-                "has_verb": True,
-                "verb": first_word,
-                "is_strong": first_word in self.strong_action_verbs,
-                "is_weak_starter": first_word in self.non_action_starters,
-                "is_first_word": True,
-                "context_score": 0.5  # Neutral context score without NLP
-            }
+            return self._extract_first_word_context(cleaned_text)
         
         # Use SpaCy for advanced analysis
-        doc = self.nlp(cleaned_text)
-        
-        # Find all verbs in the sentence
-        verbs = []
-        for token in doc:
-            if token.pos_ == "VERB":
-                is_main = token.dep_ == "ROOT"
-                verb_obj = {
-                    "text": token.lemma_.lower(),
-                    "original": token.text.lower(),
-                    "is_first_word": token.i == 0,
-                    "is_main": is_main,
-                    "position": token.i,
-                    "has_object": any(child.dep_ in ("dobj", "pobj") for child in token.children),
-                    "has_quantifier": any(child.dep_ in ("nummod", "quantmod") for child in token.children),
-                    "token": token
-                }
-                verbs.append(verb_obj)
+        return self.extract_verb_context_from_doc(self.nlp(cleaned_text))
+    
+    def extract_verb_contexts(self, bullets: List[str], n_process: int = 1,
+                              batch_size: int = ACTION_VERB_SPACY_BATCH_SIZE) -> List[Dict[str, Any]]:
+        """
+        Extract verb context for many bullets, batching them through SpaCy.
+        
+        Args:
+            bullets: Bullet point texts
+            n_process: Number of SpaCy worker processes
+            batch_size: Bullets per SpaCy batch
+            
+        Returns:
+            List of verb context dicts, one per bullet
+        """
+        # Cleaned lazily so SpaCy starts parsing before every bullet is cleaned
+        cleaned = (self._clean_bullet(bullet) for bullet in bullets)
+        
+        if not self.nlp:
+            return [self._extract_first_word_context(text) for text in cleaned]
         
-        if not verbs:
+        # nlp.pipe yields Docs in input order, so results line up with bullets
+        docs = self.nlp.pipe(cleaned, batch_size=batch_size, n_process=n_process)
+        return [self.extract_verb_context_from_doc(doc) for doc in docs]
+    
+    def _clean_bullet(self, text: str) -> str:
+        """Strip any leading bullet symbol and whitespace."""
+        stripped = text.strip()
+        # Most bullets reach here already trimmed by extract_bullet_points
+        if not stripped or stripped[0] not in _BULLET_SYMBOLS:
+            return stripped
+        return _BULLET_PREFIX_RE.sub('', stripped).strip()
+    
+    def _extract_first_word_context(self, cleaned_text: str) -> Dict[str, Any]:
+        """Fallback to simple first-word extraction if SpaCy is not available."""
+        match = _FIRST_WORD_RE.search(cleaned_text)
+        if not match:
+            return {"has_verb": False}
+            
+        first_word = match.group(0).lower()
+        return {
+            "has_verb": True,
+            "verb": first_word,
+            "is_strong": first_word in self.strong_action_verbs,
+            "is_weak_starter": first_word in self.non_action_starters,
+            "is_first_word": True,
+            "context_score": 0.5  # Neutral context score without NLP
+        }
+    
+    def extract_verb_context_from_doc(self, doc) -> Dict[str, Any]:
+        """
+        Extract the main verb and its context from a parsed SpaCy Doc.
+        
+        Args:
+            doc: SpaCy Doc of a cleaned bullet point
+            
+        Returns:
+            Dict with verb information and context
+        """
+        # Prioritize the main (ROOT) verb, then the first verb
+        target = next((token for token in doc
+                       if token.pos == self._verb_pos and token.dep == self._root_dep), None)
+        if target is None:
+            target = next((token for token in doc if token.pos == self._verb_pos), None)
+        
+        if target is None:
             return {"has_verb": False}
         
-        # Prioritize main verb, then first verb
-        main_verbs = [v for v in verbs if v["is_main"]]
-        target_verb = main_verbs[0] if main_verbs else verbs[0]
+        lemma = target.lemma_.lower()
+        original = target.text.lower()
+        # One pass over the children, stopping once both flags are set
+        has_object = has_quantifier = False
+        for child in target.children:
+            dep = child.dep
+            if dep in self._object_deps:
+                has_object = True
+            elif dep in self._quantifier_deps:
+                has_quantifier = True
+            if has_object and has_quantifier:
+                break
         
         # Calculate contextual score based on verb usage
         context_score = 0.5  # Start with neutral score
         
         # Increase score for verbs with direct objects (more concrete actions)
-        if target_verb["has_object"]:
+        if has_object:
             context_score += 0.25
             
         # Increase score for quantified achievements
-        if target_verb["has_quantifier"]:
+        if has_quantifier:
             context_score += 0.25
             
         # Check if the verb is in our strong verb list
-        is_strong = target_verb["text"] in self.strong_action_verbs or target_verb["original"] in self.strong_action_verbs
+        is_strong = lemma in self.strong_action_verbs or original in self.strong_action_verbs
             
         return {
             "has_verb": True,
-            "verb": target_verb["text"],
-            "original_verb": target_verb["original"],
+            "verb": lemma,
+            "original_verb": original,
             "is_strong": is_strong,
-            "is_weak_starter": target_verb["text"] in self.non_action_starters,
-            "is_first_word": target_verb["is_first_word"],
-            "is_main_verb": target_verb["is_main"],
-            "has_object": target_verb["has_object"],
+            "is_weak_starter": lemma in self.non_action_starters,
+            "is_first_word": target.i == 0,
+            "is_main_verb": target.dep == self._root_dep,
+            "has_object": has_object,
             "context_score": context_score
         }
     
@@ -243,104 +304,154 @@ class ActionVerbEvaluator(ResumeEvaluator):
             Dict with evaluation score and details
         """
         try:
-            # Extract bullets from the text using the base class method
-            bullets = self.extract_bullet_points(text)
-            
-            # Also try to extract specifically from experience section for better results
-            experience_section = self.extract_section(
-                text, 
-                ["experience", "employment", "work history", "professional background"]
-            )
+            bullets = self._select_bullets(text)
+            non_empty_bullets = [bullet for bullet in bullets if bullet and bullet.strip()]
+            contexts = self.extract_verb_contexts(non_empty_bullets)
+            return self._score_contexts(text, bullets, contexts, domain)
+        except Exception as e:
+            print(f"Error in action verb evaluation: {e}")
+            return {"score": 60, "details": {"error": str(e)}}
+    
+    async def evaluate_async(self, text: str, domain: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Run evaluate in a worker thread so async callers don't block the event loop.
+        
+        Args:
+            text: The resume text to evaluate
+            domain: Optional domain to evaluate against
             
-            if experience_section:
-                experience_bullets = self.extract_bullet_points(experience_section)
-                # If we found bullets in the experience section, prioritize those
-                if experience_bullets:
-                    bullets = experience_bullets
+        Returns:
+            Dict with evaluation score and details
+        """
+        return await asyncio.to_thread(self.evaluate, text, domain)
+    
+    def evaluate_batch(self, texts: List[str], domain: Optional[str] = None,
+                       n_process: int = 1, batch_size: int = 128) -> List[Dict[str, Any]]:
+        """
+        Evaluate many resumes, parsing all of their bullets in one nlp.pipe call.
+        
+        Args:
+            texts: The resume texts to evaluate
+            domain: Optional domain to evaluate against
+            n_process: Number of SpaCy worker processes
+            batch_size: Bullets per SpaCy batch
             
-            action_verbs_used = []
-            action_context_scores = []
-            non_action_count = 0
-            weak_verbs = []
-            non_first_word_verbs = 0
+        Returns:
+            List of evaluation results, one per resume
+        """
+        bullets_per_resume = []
+        counts = []
+        all_bullets = []
+        for text in texts:
+            bullets = self._select_bullets(text)
+            non_empty_bullets = [bullet for bullet in bullets if bullet and bullet.strip()]
+            bullets_per_resume.append(bullets)
+            counts.append(len(non_empty_bullets))
+            all_bullets.extend(non_empty_bullets)
+        
+        contexts = self.extract_verb_contexts(all_bullets, n_process=n_process, batch_size=batch_size)
+        
+        results = []
+        offset = 0
+        for text, bullets, count in zip(texts, bullets_per_resume, counts):
+            try:
+                results.append(self._score_contexts(text, bullets, contexts[offset:offset + count], domain))
+            except Exception as e:
+                logger.exception("Error in action verb evaluation")
+                results.append({"score": 60, "details": {"error": str(e)}})
+            offset += count
+        return results
+    
+    def _select_bullets(self, text: str) -> List[str]:
+        """Extract bullets, preferring those from the experience section."""
+        # Try the experience section first for better results
+        experience_section = self.extract_section(
+            text, 
+            ["experience", "employment", "work history", "professional background"]
+        )
+        bullets = self.extract_bullet_points(experience_section) if experience_section else []
+        
+        # Fall back to the whole resume only if the section yields nothing
+        if not bullets:
+            bullets = self.extract_bullet_points(text)
+        return bullets
+    
+    def _score_contexts(self, text: str, bullets: List[str], contexts: List[Dict[str, Any]],
+                        domain: Optional[str] = None) -> Dict[str, Any]:
+        """Score a resume from the verb contexts of its non-empty bullets."""
+        action_verbs_used = []
+        action_context_scores = []
+        weak_verbs = []
+        non_first_word_verbs = 0
+        
+        # Empty bullets count as non-action
+        non_action_count = len(bullets) - len(contexts)
+        
+        for context in contexts:
+            if not context["has_verb"]:
+                non_action_count += 1
+                continue
             
-            for bullet in bullets:
-                if not bullet.strip():
-                    non_action_count += 1
-                    continue
-                
-                # Get verb context using NLP
-                context = self.extract_verb_context(bullet)
-                
-                if not context["has_verb"]:
-                    non_action_count += 1
-                    continue
+            if context["is_strong"]:
+                action_verbs_used.append(context["verb"])
+                action_context_scores.append(context["context_score"])
                 
-                if context["is_strong"]:
-                    action_verbs_used.append(context["verb"])
-                    action_context_scores.append(context["context_score"])
-                    
-                    # Track verbs that aren't the first word
-                    if not context["is_first_word"]:
-                        non_first_word_verbs += 1
-                elif context["is_weak_starter"]:
-                    non_action_count += 1
+                # Track verbs that aren't the first word
+                if not context["is_first_word"]:
+                    non_first_word_verbs += 1
+            elif context["is_weak_starter"]:
+                non_action_count += 1
+                weak_verbs.append(context["verb"])
+            else:
+                non_action_count += 1
+                # Only add to weak verbs list if it's a verb that could be improved
+                if context["verb"].endswith(('ed', 'ing')):
                     weak_verbs.append(context["verb"])
-                else:
-                    non_action_count += 1
-                    # Only add to weak verbs list if it's a verb that could be improved
-                    if context["verb"].endswith('ed') or context["verb"].endswith('ing'):
-                        weak_verbs.append(context["verb"])
-            
-            # Calculate duplicate penalties
-            verb_counts = defaultdict(int)
-            for verb in action_verbs_used:
-                verb_counts[verb] += 1
-            duplicates = sum(count - 1 for count in verb_counts.values())
-            
-            # Calculate context quality (average of all context scores)
-            avg_context_score = sum(action_context_scores) / max(1, len(action_context_scores))
-            
-            # Calculate score components
-            action_reward = len(action_verbs_used) * ACTION_VERB_WEIGHTS['action_reward']
-            non_action_penalty = non_action_count * ACTION_VERB_WEIGHTS['non_action_penalty']
-            duplicate_penalty = duplicates * ACTION_VERB_WEIGHTS['duplicate_penalty']
-            
-            # Add context bonus (scale from -10 to +10 points)
-            context_bonus = (avg_context_score - 0.5) * 20
-            
-            raw_score = action_reward - non_action_penalty - duplicate_penalty + context_bonus
-            
-            # Normalize score to 0-100 range
-            bullet_count = len(bullets) or 1  # Avoid division by zero
-            normalized_score = min(100, max(0, 50 + (raw_score * 100 / (bullet_count * 2))))
-            
-            result = {
-                "score": round(normalized_score, 1),
-                "details": {
-                    "bullets_count": len(bullets),
-                    "action_verbs_count": len(action_verbs_used),
-                    "non_action_count": non_action_count,
-                    "duplicate_count": duplicates,
-                    "non_first_word_verbs": non_first_word_verbs,
-                    "context_quality": round(avg_context_score, 2),
-                    "action_verbs_used": dict(verb_counts),
-                    "weak_verbs": list(set(weak_verbs))[:10],  # Show only top weak verbs
-                    "components": {
-                        "action_reward": action_reward,
-                        "non_action_penalty": non_action_penalty,
-                        "duplicate_penalty": duplicate_penalty,
-                        "context_bonus": round(context_bonus, 1)
-                    }
+        
+        # Calculate duplicate penalties
+        verb_counts = Counter(action_verbs_used)
+        duplicates = len(action_verbs_used) - len(verb_counts)
+        
+        # Calculate context quality (average of all context scores)
+        avg_context_score = sum(action_context_scores) / max(1, len(action_context_scores))
+        
+        # Calculate score components
+        action_reward = len(action_verbs_used) * ACTION_VERB_WEIGHTS['action_reward']
+        non_action_penalty = non_action_count * ACTION_VERB_WEIGHTS['non_action_penalty']
+        duplicate_penalty = duplicates * ACTION_VERB_WEIGHTS['duplicate_penalty']
+        
+        # Add context bonus (scale from -10 to +10 points)
+        context_bonus = (avg_context_score - 0.5) * 20
+        
+        raw_score = action_reward - non_action_penalty - duplicate_penalty + context_bonus
+        
+        # Normalize score to 0-100 range
+        bullet_count = len(bullets) or 1  # Avoid division by zero
+        normalized_score = min(100, max(0, 50 + (raw_score * 100 / (bullet_count * 2))))
+        
+        result = {
+            "score": round(normalized_score, 1),
+            "details": {
+                "bullets_count": len(bullets),
+                "action_verbs_count": len(action_verbs_used),
+                "non_action_count": non_action_count,
+                "duplicate_count": duplicates,
+                "non_first_word_verbs": non_first_word_verbs,
+                "context_quality": round(avg_context_score, 2),
+                "action_verbs_used": dict(verb_counts),
+                "weak_verbs": list(dict.fromkeys(weak_verbs))[:10],  # First 10 distinct, in order
+                "components": {
+                    "action_reward": action_reward,
+                    "non_action_penalty": non_action_penalty,
+                    "duplicate_penalty": duplicate_penalty,
+                    "context_bonus": round(context_bonus, 1)
                 }
             }
-            
-            # Add domain-specific evaluation if a domain was specified
-            if domain and domain in self.domain_specific_verbs:
-                domain_results = self.get_domain_strength(text, domain)
-                result["details"]["domain_specific"] = domain_results
-            
-            return result
-        except Exception as e:
-            print(f"Error in action verb evaluation: {e}")
-            return {"score": 60, "details": {"error": str(e)}}
\ No newline at end of file
+        }
+        
+        # Add domain-specific evaluation if a domain was specified
+        if domain and domain in self.domain_specific_verbs:
+            domain_results = self.get_domain_strength(text, domain)
+            result["details"]["domain_specific"] = domain_results
+        
+        return result
\ No newline at end of file
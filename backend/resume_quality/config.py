@@ -96,6 +96,7 @@ ACTION_VERB_WEIGHTS = {
     'non_action_penalty': 1.0,   # Points deducted for weak or missing verbs
     'duplicate_penalty': 0.5     # Points deducted for repeated verbs
 }
+ACTION_VERB_SPACY_BATCH_SIZE = 64  # Bullets per nlp.pipe batch
 
 # Structure Configuration
 STRUCTURE_ESSENTIALS = {
@@ -1,9 +1,10 @@
 import time
 import logging
-from functools import lru_cache
-import hashlib
-from backend.utils.spacy_model import nlp
-from typing import Dict, Any,Optional
+import threading
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional
 from .grammar_spelling import GrammarSpellingEvaluator
 from .readability import ReadabilityEvaluator
 from .format import FormattingEvaluator
@@ -11,6 +12,7 @@ from .tense_timeline import TenseTimelineEvaluator
 from .action_verb import ActionVerbEvaluator
 from .structure import StructureEvaluator  # Add the new evaluator
 from .config import CV_QUALITY_COMPONENT_WEIGHTS
+from backend.utils.cache_key import text_cache_key
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, 
@@ -36,17 +38,51 @@ class CVQualityEvaluator:
             'structure': StructureEvaluator()  # Add the new evaluator
         }
         
+        # Long-lived pool so worker threads are reused across evaluations
+        self._executor = ThreadPoolExecutor(max_workers=max(1, len(self.evaluators) - 1),
+                                            thread_name_prefix='cv_quality')
+        
         self.weights = weights or CV_QUALITY_COMPONENT_WEIGHTS.copy()
-        logger.info(f"Initialized CV quality evaluator with weights: {self.weights}")
+        logger.info("Initialized CV quality evaluator with weights: %s", self.weights)
+        
+        # Weights as a vector over the components that actually have an evaluator,
+        # pre-divided by their total so scoring is a single dot product
+        self._weight_keys = [name for name in self.weights if name in self.evaluators]
+        weight_vec = np.array([self.weights[name] for name in self._weight_keys], dtype=np.float64)
+        weight_sum = float(weight_vec.sum())
+        self._normalized_weights = weight_vec / weight_sum if weight_sum else None
         
-        # Cache to avoid re-evaluating the same text
-        self._evaluation_cache = {}
+        # LRU cache to avoid re-evaluating the same text
+        self._evaluation_cache = OrderedDict()
+        self._cache_max = 100
+        self._cache_lock = threading.Lock()
     
     def _get_cache_key(self, text: str) -> str:
         """Generate a cache key from text content."""
-        return hashlib.md5(text.encode()).hexdigest()
+        return text_cache_key(text)
+    
+    @staticmethod
+    def _run_timed(name: str, evaluator, text: str) -> Dict[str, Any]:
+        """Run one component evaluator and log how long it took."""
+        start_time = time.perf_counter()
+        result = evaluator.evaluate(text)
+        elapsed = time.perf_counter() - start_time
+        logger.debug("%s evaluation completed in %.2fs", name, elapsed)
+        return result
+    
+    @staticmethod
+    def _collect(name: str, get_result, results: Dict[str, Any], component_errors: Dict[str, str]):
+        """Store one component's result, or a default score if it failed."""
+        try:
+            results[name] = get_result()
+        except Exception as e:
+            logger.error("Error in %s evaluation: %s", name, e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s evaluation traceback", name, exc_info=True)
+            component_errors[name] = str(e)
+            # Provide default scores if evaluator fails
+            results[name] = {"score": 60, "details": {"error": str(e)}}
     
-    @lru_cache(maxsize=100)
     def evaluate(self, text: str) -> Dict[str, Any]:
         """
         Evaluate the overall quality of a CV/resume.
@@ -59,47 +95,114 @@ class CVQualityEvaluator:
         """
         # Check cache
         cache_key = self._get_cache_key(text)
-        if cache_key in self._evaluation_cache:
-            logger.info(f"Using cached evaluation for {cache_key[:8]}...")
-            return self._evaluation_cache[cache_key]
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        result = self._evaluate_uncached(text)
+        self._cache_put(cache_key, result)
+        return result
+    
+    def evaluate_batch(self, texts: List[str], n_process: int = 1) -> List[Dict[str, Any]]:
+        """
+        Evaluate many resumes, parsing all of their action-verb bullets in one nlp.pipe call.
         
-        logger.info(f"Evaluating resume quality (length: {len(text)} chars)")
+        Cached results are reused, and duplicate texts within the batch are evaluated once.
         
+        Args:
+            texts: The full texts of the resumes
+            n_process: Number of SpaCy worker processes (keep 1 where forking is unsafe)
+            
+        Returns:
+            List of evaluation results, one per resume, in input order
+        """
+        keys = [self._get_cache_key(text) for text in texts]
         results = {}
+        pending = {}
+        for key, text in zip(keys, texts):
+            if key in results or key in pending:
+                continue
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                pending[key] = text
+        
+        if pending:
+            pending_texts = list(pending.values())
+            precomputed = [{} for _ in pending_texts]
+            
+            # Action verbs are the only component that can batch across resumes
+            action_verbs = self.evaluators.get('action_verbs')
+            if isinstance(action_verbs, ActionVerbEvaluator):
+                try:
+                    batch_results = action_verbs.evaluate_batch(pending_texts, n_process=n_process)
+                    for known, action_result in zip(precomputed, batch_results):
+                        known['action_verbs'] = action_result
+                except Exception as e:
+                    # Fall back to evaluating action verbs per resume
+                    logger.error("Error in batched action_verbs evaluation: %s", e)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Batched action_verbs evaluation traceback", exc_info=True)
+            
+            for key, text, known in zip(pending, pending_texts, precomputed):
+                results[key] = self._evaluate_uncached(text, known)
+                self._cache_put(key, results[key])
+        
+        return [results[key] for key in keys]
+    
+    def _cache_get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached evaluation and mark it as most recently used."""
+        with self._cache_lock:
+            cached = self._evaluation_cache.get(cache_key)
+            if cached is not None:
+                self._evaluation_cache.move_to_end(cache_key)
+        if cached is not None:
+            # Short texts are their own key, so the key is never logged
+            logger.info("Using cached evaluation")
+        return cached
+    
+    def _cache_put(self, cache_key: str, result: Dict[str, Any]):
+        """Store an evaluation, evicting the least recently used entries."""
+        with self._cache_lock:
+            self._evaluation_cache[cache_key] = result
+            while len(self._evaluation_cache) > self._cache_max:
+                self._evaluation_cache.popitem(last=False)
+    
+    def _evaluate_uncached(self, text: str, precomputed: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run the component evaluators (except any precomputed ones) and combine their scores."""
+        logger.info("Evaluating resume quality (length: %d chars)", len(text))
+        
+        results = dict(precomputed or {})
         component_errors = {}
         
-        # Run each evaluator with proper error handling
-        for name, evaluator in self.evaluators.items():
-            try:
-                logger.debug(f"Running {name} evaluator")
-                start_time = time.time()
-                results[name] = evaluator.evaluate(text)
-                elapsed = time.time() - start_time
-                logger.debug(f"{name} evaluation completed in {elapsed:.2f}s")
-            except Exception as e:
-                logger.error(f"Error in {name} evaluation: {str(e)}", exc_info=True)
-                component_errors[name] = str(e)
-                # Provide default scores if evaluator fails
-                results[name] = {"score": 60, "details": {"error": str(e)}}
-        
-        # Calculate weighted final score with safeguards
-        weighted_scores = []
-        total_weight = 0
-        
-        for component, weight in self.weights.items():
-            if component in results:
-                score = results[component]["score"]
-                # Ensure score is within valid range
-                score = max(0, min(100, score))
-                weighted_scores.append(score * weight)
-                total_weight += weight
+        # Evaluators are independent, so run them concurrently. The first (grammar, the
+        # slowest) runs on the calling thread rather than leaving it idle.
+        (first_name, first_evaluator), *others = [
+            (name, evaluator) for name, evaluator in self.evaluators.items() if name not in results
+        ]
+        futures = {}
+        for name, evaluator in others:
+            logger.debug("Running %s evaluator", name)
+            futures[self._executor.submit(self._run_timed, name, evaluator, text)] = name
+        
+        logger.debug("Running %s evaluator", first_name)
+        self._collect(first_name, lambda: self._run_timed(first_name, first_evaluator, text),
+                      results, component_errors)
+        for future in as_completed(futures):
+            self._collect(futures[future], future.result, results, component_errors)
+        
+        # Calculate weighted final score, clipping each score to the valid range
+        # (every evaluator has a result, failed ones carry the default score)
+        scores = np.clip(np.array([results[name]["score"] for name in self._weight_keys],
+                                  dtype=np.float64), 0, 100)
         
         # Prevent division by zero
-        if total_weight == 0:
+        if self._normalized_weights is None:
             logger.warning("No valid components to evaluate, using default score")
             final_score = 60.0
         else:
-            final_score = sum(weighted_scores) / total_weight
+            final_score = float(np.dot(scores, self._normalized_weights))
             
         final_score = round(final_score, 1)
         
@@ -121,12 +224,23 @@ class CVQualityEvaluator:
             "errors": component_errors if component_errors else None
         }
         
-        # Store in cache
-        self._evaluation_cache[cache_key] = result
-        logger.info(f"Evaluation complete. Final score: {final_score}")
+        logger.info("Evaluation complete. Final score: %s", final_score)
         
         return result
 
+# Shared evaluator for the convenience function, created on first use
+_default_evaluator = None
+_default_evaluator_lock = threading.Lock()
+
+def _get_default_evaluator() -> CVQualityEvaluator:
+    """Return the shared CVQualityEvaluator, building it once."""
+    global _default_evaluator
+    if _default_evaluator is None:
+        with _default_evaluator_lock:  # Lock during initialization only
+            if _default_evaluator is None:
+                _default_evaluator = CVQualityEvaluator()
+    return _default_evaluator
+
 # Convenience function
 def evaluate_cv_quality(resume_text: str) -> Dict[str, Any]:
     """
@@ -138,5 +252,16 @@ def evaluate_cv_quality(resume_text: str) -> Dict[str, Any]:
     Returns:
         Dict containing overall score and component scores
     """
-    evaluator = CVQualityEvaluator()
-    return evaluator.evaluate(resume_text)
\ No newline at end of file
+    return _get_default_evaluator().evaluate(resume_text)
+
+def evaluate_cv_quality_batch(resume_texts: List[str]) -> List[Dict[str, Any]]:
+    """
+    Convenience function to evaluate the CV quality of many resumes at once.
+    
+    Args:
+        resume_texts: The full texts of the resumes
+        
+    Returns:
+        List of dicts containing overall score and component scores, one per resume
+    """
+    return _get_default_evaluator().evaluate_batch(resume_texts)
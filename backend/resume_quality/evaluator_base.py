@@ -1,8 +1,63 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import os
 import re
+import sys
 import time
-from functools import wraps
+from functools import lru_cache, wraps
+from backend.utils.spacy_model import load_model
+
+# Set PROFILE=1 to record execution_time_ms in each evaluator's details
+PROFILE_EVALUATIONS = bool(os.getenv("PROFILE"))
+
+# Common bullet point patterns, and sentence boundaries for the no-bullet fallback
+_BULLET_RE = re.compile(r'(?:^|\n)[\s]*([•\-*>–])[\s]+(.*?)(?=\n[\s]*[•\-*>–][\s]+|\n\n|$)', re.DOTALL)
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+DEFAULT_END_SECTION_HEADERS = tuple(sys.intern(h) for h in (
+    "education", "skills", "projects", "certifications",
+    "interests", "awards", "publications", "references"))
+
+def load_spacy_model(model_name: str):
+    """Load a spaCy model once per process; every evaluator using it shares the instance."""
+    # Evaluators use POS tags, morphology, dependencies and lemmas, never entities
+    return load_model(model_name, ("ner",))
+
+@lru_cache(maxsize=64)
+def _section_matcher(section_headers: Tuple[str, ...], end_headers: Tuple[str, ...]):
+    """
+    Build (once per header configuration) the header alternation and lookup sets.
+    
+    Returns:
+        Tuple of (compiled regex, frozenset of start headers, frozenset of end headers)
+    """
+    start_set = frozenset(sys.intern(h.lower()) for h in section_headers)
+    # A header that can open the section never closes it
+    end_set = frozenset(sys.intern(h.lower()) for h in end_headers) - start_set
+    
+    # Longest first, so "professional experience" wins over "experience" at the same spot
+    ordered = sorted(set(section_headers + end_headers), key=len, reverse=True)
+    pattern = re.compile(r"\b(?:" + "|".join(map(re.escape, ordered)) + r")\b", re.IGNORECASE)
+    return pattern, start_set, end_set
+
+def timed_evaluation(func):
+    """Decorator to time evaluation methods and add timing to result details."""
+    # Without profiling the method is left unwrapped, so there is no per-call overhead
+    if not PROFILE_EVALUATIONS:
+        return func
+    
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        start_ns = time.perf_counter_ns()
+        result = func(self, *args, **kwargs)
+        execution_ns = time.perf_counter_ns() - start_ns
+        
+        if isinstance(result, dict) and 'details' in result:
+            if isinstance(result['details'], dict):
+                result['details']['execution_time_ms'] = round(execution_ns / 1e6, 2)
+        
+        return result
+    return wrapper
 
 class ResumeEvaluator(ABC):
     """Base class for all resume quality evaluators."""
@@ -26,23 +81,27 @@ class ResumeEvaluator(ABC):
         """Return the name of the evaluator (defaults to class name)."""
         return self.__class__.__name__
     
-    def extract_bullet_points(self, text: str) -> List[str]:
+    def extract_bullet_points(self, text: str, doc=None) -> List[str]:
         """
         Extract bullet points from resume text using common patterns.
         
         Args:
             text: The text to extract bullet points from
+            doc: Optional SpaCy Doc of the same text; its sentences are reused
+                 for the no-bullet fallback instead of a regex split
             
         Returns:
             List of bullet point strings
         """
         # Match common bullet point patterns
-        bullet_pattern = r'(?:^|\n)[\s]*([•\-*>–])[\s]+(.*?)(?=\n[\s]*[•\-*>–][\s]+|\n\n|$)'
-        bullets = [m.group(2).strip() for m in re.finditer(bullet_pattern, text, re.DOTALL)]
+        bullets = [m.group(2).strip() for m in _BULLET_RE.finditer(text)]
         
         # If no bullet points found, try to use sentences as fallback
         if not bullets:
-            sentences = re.split(r'(?<=[.!?])\s+', text)
+            if doc is not None and doc.has_annotation("SENT_START"):
+                sentences = [sent.text for sent in doc.sents]
+            else:
+                sentences = _SENTENCE_SPLIT_RE.split(text)
             bullets = [s.strip() for s in sentences if len(s.strip()) > 10]
         
         return bullets
@@ -61,46 +120,28 @@ class ResumeEvaluator(ABC):
         Returns:
             Extracted section text or empty string if not found
         """
-        if not end_section_headers:
-            end_section_headers = ["education", "skills", "projects", "certifications", 
-                                  "interests", "awards", "publications", "references"]
+        end_headers = tuple(end_section_headers) if end_section_headers else DEFAULT_END_SECTION_HEADERS
+        
+        pattern, start_headers, end_set = _section_matcher(tuple(section_headers), end_headers)
         
+        # One pass over every header occurrence: the first start header opens the
+        # section, and the next end header after it closes the section
         section_start = None
-        for header in section_headers:
-            pattern = rf"\b{re.escape(header)}\b"
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                section_start = match.start()
+        section_end = None
+        for match in pattern.finditer(text):
+            header = match.group(0).lower()
+            if section_start is None:
+                if header in start_headers:
+                    section_start = match.start()
+            elif header in end_set:
+                section_end = match.start()
                 break
         
         if section_start is None:
             return ""
         
-        section_end = None
-        for header in end_section_headers:
-            if header in [h for h in section_headers if text[section_start:].lower().startswith(h.lower())]:
-                continue
-            
-            pattern = rf"\b{re.escape(header)}\b"
-            match = re.search(pattern, text[section_start:], re.IGNORECASE)
-            if match:
-                section_end = section_start + match.start()
-                break
-        
         section = text[section_start:section_end] if section_end else text[section_start:]
         return section.strip()
     
-    def timed_evaluation(func):
-        """Decorator to time evaluation methods and add timing to result details."""
-        @wraps(func)
-        def wrapper(self, *args, **kwargs):
-            start_time = time.time()
-            result = func(self, *args, **kwargs)
-            execution_time = time.time() - start_time
-            
-            if isinstance(result, dict) and 'details' in result:
-                if isinstance(result['details'], dict):
-                    result['details']['execution_time_ms'] = round(execution_time * 1000, 2)
-            
-            return result
-        return wrapper
+    # Kept on the class so evaluators can keep using @ResumeEvaluator.timed_evaluation
+    timed_evaluation = staticmethod(timed_evaluation)
@@ -4,18 +4,52 @@ from typing import Dict, Any, Set, List
 from .evaluator_base import ResumeEvaluator
 from .config import FORMAT_MAX_CATEGORY_PENALTY, FORMAT_WEIGHTS
 
+# Heading shapes as mutually exclusive groups named after the style they imply:
+# All Caps, then Title Case words joined by spaces or by -/&, then separator-only
+# lines (no cased letters, so neither upper nor title)
+_HEADING_RE = re.compile(
+    r'(?P<all_caps>(?=[\s&]*[A-Z])[A-Z\s&]+:?)'
+    r'|(?P<title_case>[A-Z][a-z]+(?:(?: [A-Z][a-z]+)*|(?:[\-/&][A-Z][a-z]+)*):?)'
+    r'|(?P<mixed_case>[\s&]+:?)'
+)
+
+_SECTION_CHECKS = {
+    'education': re.compile(r'\b(education|academic)\b', re.I),
+    'experience': re.compile(r'\b(experience|employment|work\s*history)\b', re.I),
+    'skills': re.compile(r'\b(skills?|competencies|expertise)\b', re.I),
+    'projects': re.compile(r'\b(projects|portfolio)\b', re.I)
+}
+
+_BULLET_RE = re.compile(r'^(\s*)([•\-*●◦○]|\d+\.)\s+')
+# First non-space characters that can start a _BULLET_RE match
+_BULLET_CHARS = frozenset('•-*●◦○0123456789')
+
+# Scanned independently so formats sharing characters (e.g. "Mar 2019-2020" is
+# both month_year and year_range) are all reported
+_DATE_PATTERNS = {
+    'month_year': re.compile(r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}\b', re.I),
+    'mm/yyyy': re.compile(r'\b(?:0[1-9]|1[0-2])/\d{4}\b', re.I),
+    'yyyy-mm': re.compile(r'\d{4}-(?:0[1-9]|1[0-2])\b', re.I),
+    'full_date': re.compile(r'\b\d{4}-\d{2}-\d{2}\b', re.I),
+    'year_range': re.compile(r'\d{4}[\-–—]\d{4}\b', re.I),
+    'month_range': re.compile(r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* [\-–—] ', re.I)
+}
+
+_MULTI_SPACE_RE = re.compile(r'\s{2,}')
+
 class FormattingEvaluator(ResumeEvaluator):
     """Evaluates the formatting quality of a resume."""
     
     def evaluate(self, text: str) -> Dict[str, Any]:
         try:
-            lines = [line.strip() for line in text.split('\n')]
+            # One pass over the lines gathers everything the analyses below need
+            state = self._scan_lines(text)
             penalties = defaultdict(int)
-            section_details = self._analyze_sections(lines)
+            section_details = self._analyze_sections(state)
             # Use base class method for bullet point extraction
-            bullet_details = self._analyze_bullet_points(text)
-            date_details = self._analyze_date_formats(lines)
-            spacing_details = self._analyze_spacing(lines)
+            bullet_details = self._analyze_bullet_points(text, state)
+            date_details = self._analyze_date_formats(state)
+            spacing_details = self._analyze_spacing(state)
             
             # Calculate penalties for each category
             penalties['sections'] = min(
@@ -64,38 +98,46 @@ class FormattingEvaluator(ResumeEvaluator):
             print(f"Error in format evaluation: {e}")
             return {"score": 60, "details": {"error": str(e)}}  # Default fallback score
     
-    def _analyze_sections(self, lines: List[str]) -> Dict[str, Any]:
-        """Analyze headings and sections."""
-        heading_patterns = [
-            re.compile(r'^[A-Z][a-z]+(?: [A-Z][a-z]+)*:?$'),  # Title Case
-            re.compile(r'^[A-Z\s&]+:?$'),                     # All Caps
-            re.compile(r'^[A-Z][a-z]+(?:[\-/&][A-Z][a-z]+)*:?$')  # Mixed case
-        ]
-        
-        section_checks = {
-            'education': re.compile(r'\b(education|academic)\b', re.I),
-            'experience': re.compile(r'\b(experience|employment|work\s*history)\b', re.I),
-            'skills': re.compile(r'\b(skills?|competencies|expertise)\b', re.I),
-            'projects': re.compile(r'\b(projects|portfolio)\b', re.I)
-        }
-        
+    def _scan_lines(self, text: str) -> Dict[str, Any]:
+        """Walk the resume lines once, collecting heading, bullet, date and spacing state."""
         headings = []
         heading_styles = set()
         with_colon = 0
         without_colon = 0
         present_sections = set()
+        bullet_styles = defaultdict(set)
+        formats = set()
+        format_examples = {}
+        multi_space_count = 0
+        consecutive_empty = 0
+        empty_lines_count = 0
+        prev_empty = False
         
-        for line in lines:
-            if any(pattern.fullmatch(line) for pattern in heading_patterns):
+        for raw_line in text.split('\n'):
+            line = raw_line.strip()
+            
+            # Bullet style and indentation come from the unstripped line; only
+            # lines starting with a bullet character or digit can match
+            if line[:1] in _BULLET_CHARS:
+                match = _BULLET_RE.match(raw_line)
+                if match:
+                    bullet_styles[match.group(2)].add(len(match.group(1)))
+            
+            # Consecutive empty lines (an empty line matches no other check)
+            if not line:
+                empty_lines_count += 1
+                if prev_empty:
+                    consecutive_empty += 1
+                prev_empty = True
+                continue
+            prev_empty = False
+            
+            heading = _HEADING_RE.fullmatch(line)
+            if heading:
                 headings.append(line)
                 
                 # Track heading styles
-                if line.isupper():
-                    heading_styles.add('all_caps')
-                elif line.istitle():
-                    heading_styles.add('title_case')
-                else:
-                    heading_styles.add('mixed_case')
+                heading_styles.add(heading.lastgroup)
                 
                 # Track colon usage
                 if ':' in line:
@@ -104,19 +146,45 @@ class FormattingEvaluator(ResumeEvaluator):
                     without_colon += 1
                 
                 # Section detection
-                for section, pattern in section_checks.items():
+                for section, pattern in _SECTION_CHECKS.items():
                     if pattern.search(line):
                         present_sections.add(section)
                         break
+            
+            for name, pattern in _DATE_PATTERNS.items():
+                for match in pattern.finditer(line):
+                    formats.add(name)
+                    format_examples[name] = match.group(0)
+            
+            # Multiple spaces between words
+            if _MULTI_SPACE_RE.search(line):
+                multi_space_count += 1
         
+        return {
+            'headings': headings,
+            'heading_styles': heading_styles,
+            'with_colon': with_colon,
+            'without_colon': without_colon,
+            'present_sections': present_sections,
+            'bullet_styles': bullet_styles,
+            'date_formats': formats,
+            'date_examples': format_examples,
+            'multi_space_count': multi_space_count,
+            'consecutive_empty': consecutive_empty,
+            'empty_lines_count': empty_lines_count
+        }
+    
+    def _analyze_sections(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyze headings and sections."""
+        present_sections = state['present_sections']
         missing = {'education', 'experience', 'skills', 'projects'} - present_sections
-        mixed_style = len(heading_styles) > 1
-        mixed_colons = with_colon > 0 and without_colon > 0
+        mixed_style = len(state['heading_styles']) > 1
+        mixed_colons = state['with_colon'] > 0 and state['without_colon'] > 0
         
         return {
             'headings': {
-                'count': len(headings),
-                'styles': list(heading_styles),
+                'count': len(state['headings']),
+                'styles': list(state['heading_styles']),
                 'mixed_style': mixed_style,
                 'mixed_colons': mixed_colons
             },
@@ -124,81 +192,31 @@ class FormattingEvaluator(ResumeEvaluator):
             'missing': list(missing)
         }
     
-    def _analyze_bullet_points(self, text: str) -> Dict[str, Any]:
+    def _analyze_bullet_points(self, text: str, state: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze bullet point consistency."""
-        bullet_regex = re.compile(r'^(\s*)([•\-*●◦○]|\d+\.)\s+')
-        styles = defaultdict(set)
-        
         # Use the base class method to get bullets
         bullets = self.extract_bullet_points(text)
-        bullet_count = len(bullets)
-        
-        # Analyze the formatting styles
-        for line in text.split('\n'):
-            match = bullet_regex.match(line)
-            if match:
-                indent = len(match.group(1))
-                symbol = match.group(2)
-                styles[symbol].add(indent)
         
         return {
-            'count': bullet_count,
-            'styles': dict((k, list(v)) for k, v in styles.items())
+            'count': len(bullets),
+            'styles': dict((k, list(v)) for k, v in state['bullet_styles'].items())
         }
     
-    def _analyze_date_formats(self, lines: List[str]) -> Dict[str, Any]:
+    def _analyze_date_formats(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze date format consistency."""
-        date_patterns = {
-            'month_year': r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}\b',
-            'mm/yyyy': r'\b(0[1-9]|1[0-2])/\d{4}\b',
-            'yyyy-mm': r'\d{4}-(0[1-9]|1[0-2])\b',
-            'full_date': r'\b\d{4}-\d{2}-\d{2}\b',
-            'year_range': r'\d{4}[\-–—]\d{4}\b',
-            'month_range': r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* [\-–—] '
-        }
-        
-        formats = set()
-        format_examples = {}
-        
-        for line in lines:
-            for name, pattern in date_patterns.items():
-                matches = re.finditer(pattern, line, re.IGNORECASE)
-                for match in matches:
-                    formats.add(name)
-                    format_examples[name] = match.group(0)
-        
         return {
-            'formats': list(formats),
-            'examples': format_examples
+            'formats': list(state['date_formats']),
+            'examples': state['date_examples']
         }
     
-    def _analyze_spacing(self, lines: List[str]) -> Dict[str, Any]:
+    def _analyze_spacing(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze spacing consistency."""
-        multi_space_count = 0
-        consecutive_empty = 0
-        empty_lines_count = 0
-        issues = 0
-        
-        prev_empty = False
-        for line in lines:
-            # Multiple spaces between words
-            if re.search(r'\s{2,}', line.strip()):
-                multi_space_count += 1
-                issues += 1
-            
-            # Consecutive empty lines
-            if not line.strip():
-                empty_lines_count += 1
-                if prev_empty:
-                    consecutive_empty += 1
-                    issues += 1
-                prev_empty = True
-            else:
-                prev_empty = False
+        multi_space_count = state['multi_space_count']
+        consecutive_empty = state['consecutive_empty']
         
         return {
             'multi_space_count': multi_space_count,
             'consecutive_empty': consecutive_empty,
-            'empty_lines_count': empty_lines_count,
-            'issues': issues
+            'empty_lines_count': state['empty_lines_count'],
+            'issues': multi_space_count + consecutive_empty
         }
@@ -1,38 +1,81 @@
-import language_tool_python
 import re
-from collections import defaultdict
-from typing import Dict, List, Tuple, Any
+import copy
+import hashlib
+from collections import OrderedDict, defaultdict
 from functools import lru_cache
+from typing import Dict, List, Tuple, Any
 import threading
+import numpy as np
 from .evaluator_base import ResumeEvaluator
 from .config import (
     GRAMMAR_BASE_SCORE, GRAMMAR_MIN_SCORE, GRAMMAR_MAX_SCORE, GRAMMAR_LENGTH_NORMALIZATION,
     GRAMMAR_ERROR_WEIGHTS, GRAMMAR_DENSITY_THRESHOLDS, GRAMMAR_PROXIMITY_PENALTY, GRAMMAR_CATEGORY_RULES
 )
 
-# Thread-local storage for LanguageTool instances
-_thread_local = threading.local()
+# One LanguageTool (and Java server) per process, shared by every thread;
+# the server handles concurrent check() requests itself
+_language_tool = None
+_language_tool_lock = threading.Lock()
+
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\n')
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])\s+')
+_WORD_RE = re.compile(r'\w+')
+# A sentence is a run between . ! ? terminators with at least one non-space character
+_SENTENCE_RE = re.compile(r'[^.!?\s][^.!?]*')
+
+# One alternation per category, checked in GRAMMAR_CATEGORY_RULES order
+_CATEGORY_PATTERNS = [
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in GRAMMAR_CATEGORY_RULES.items()
+]
+_SPELLING_RULE_RE = re.compile(r'spell|typo')
+_SPELLING_MSG_RE = re.compile(r'misspell|unknown word')
+
+@lru_cache(maxsize=1024)
+def _error_category(rule: str, msg: str) -> str:
+    """Map a lowercased LanguageTool rule ID and message to an error category."""
+    # Explicitly check for spelling errors first
+    if _SPELLING_RULE_RE.search(rule) or _SPELLING_MSG_RE.search(msg):
+        return 'spelling'
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(msg) or pattern.search(rule):
+            return category
+    return 'other'
+
+# LanguageTool matches per checked chunk, keyed on a hash of the chunk text
+GRAMMAR_CACHE_SIZE = 50
+_grammar_cache = OrderedDict()
+_grammar_cache_lock = threading.Lock()
 
 class GrammarSpellingEvaluator(ResumeEvaluator):
     """Evaluates grammar and spelling quality of a resume."""
     
-    def __init__(self):
-        """Initialize the evaluator with necessary tools."""
-        # LanguageTool will be initialized per thread when needed
-        self.tool_lock = threading.Lock()
-    
     def _get_language_tool(self):
-        """Get or create a thread-local LanguageTool instance."""
-        if not hasattr(_thread_local, 'language_tool'):
-            with self.tool_lock:  # Lock during initialization only
-                if not hasattr(_thread_local, 'language_tool'):
-                    _thread_local.language_tool = language_tool_python.LanguageTool('en-US')
-        return _thread_local.language_tool
+        """Get or create the shared LanguageTool instance."""
+        global _language_tool
+        if _language_tool is None:
+            with _language_tool_lock:  # Lock during initialization only
+                if _language_tool is None:
+                    import language_tool_python
+                    _language_tool = language_tool_python.LanguageTool('en-US')
+        return _language_tool
     
-    @lru_cache(maxsize=50)  # Cache results for performance
     def _check_text(self, text: str) -> List[Any]:
         """Check text for grammar issues with caching."""
-        return self._get_language_tool().check(text)
+        key = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        with _grammar_cache_lock:
+            matches = _grammar_cache.get(key)
+            if matches is not None:
+                _grammar_cache.move_to_end(key)
+                return matches
+        
+        # The LanguageTool request runs outside the lock
+        matches = self._get_language_tool().check(text)
+        with _grammar_cache_lock:
+            _grammar_cache[key] = matches
+            while len(_grammar_cache) > GRAMMAR_CACHE_SIZE:
+                _grammar_cache.popitem(last=False)
+        return matches
     
     @ResumeEvaluator.timed_evaluation
     def evaluate(self, text: str) -> Dict[str, Any]:
@@ -50,22 +93,24 @@ class GrammarSpellingEvaluator(ResumeEvaluator):
             chunks = self._chunk_text(text, max_length=5000)
             all_matches = []
             
-            for chunk in chunks:
+            for chunk, start_pos in chunks:
                 matches = self._check_text(chunk)
                 
-                # Adjust offsets for chunks after the first
-                if chunk != chunks[0]:
-                    start_pos = text.find(chunk)
+                # Shift offsets into the full text; copies keep the cached matches untouched
+                if start_pos:
+                    shifted = []
                     for match in matches:
+                        match = copy.copy(match)
+                        match.errorLength = min(match.errorLength, len(chunk) - match.offset)
                         match.offset += start_pos
-                        match.errorLength = min(match.errorLength, len(chunk) - match.offset + start_pos)
+                        shifted.append(match)
+                    matches = shifted
                 
                 all_matches.extend(matches)
             
             # Basic text analysis
-            sentences = [s.strip() for s in re.split(r'[.!?]', text) if s.strip()]
-            word_count = len(re.findall(r'\w+', text))
-            sentence_count = max(len(sentences), 1)
+            word_count = len(_WORD_RE.findall(text))
+            sentence_count = max(len(_SENTENCE_RE.findall(text)), 1)
             
             # Error analysis
             error_counts, error_positions, detailed_errors = self._categorize_errors(all_matches)
@@ -113,41 +158,47 @@ class GrammarSpellingEvaluator(ResumeEvaluator):
             print(f"Error in grammar evaluation: {e}")
             return {"score": 50, "details": {"error": str(e)}}  # Lower default fallback score
     
-    def _chunk_text(self, text: str, max_length: int = 5000) -> List[str]:
-        """Split text into manageable chunks for processing."""
+    def _chunk_text(self, text: str, max_length: int = 5000) -> List[Tuple[str, int]]:
+        """Split text into manageable chunks, each paired with its offset in the text."""
         if len(text) <= max_length:
-            return [text]
+            return [(text, 0)]
         
-        # Try to split at paragraph boundaries
-        chunks = []
-        paragraphs = text.split('\n\n')
-        current_chunk = ""
-        
-        for para in paragraphs:
-            if len(current_chunk) + len(para) + 2 <= max_length:
-                current_chunk += para + '\n\n'
+        # Try to split at paragraph boundaries, and split paragraphs that are
+        # too long at sentence boundaries
+        pieces = []
+        for start, end in self._split_spans(text, 0, len(text), _PARAGRAPH_BREAK_RE):
+            if end - start > max_length:
+                pieces.extend(self._split_spans(text, start, end, _SENTENCE_BREAK_RE))
             else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                if len(para) > max_length:
-                    # If paragraph is too long, split it at sentence boundaries
-                    sentences = re.split(r'(?<=[.!?])\s+', para)
-                    current_chunk = ""
-                    for sentence in sentences:
-                        if len(current_chunk) + len(sentence) + 1 <= max_length:
-                            current_chunk += sentence + ' '
-                        else:
-                            if current_chunk:
-                                chunks.append(current_chunk.strip())
-                            current_chunk = sentence + ' '
-                else:
-                    current_chunk = para + '\n\n'
+                pieces.append((start, end))
         
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        # Merge neighbouring pieces while the chunk stays within max_length
+        spans = []
+        for start, end in pieces:
+            if spans and end - spans[-1][0] <= max_length:
+                spans[-1] = (spans[-1][0], end)
+            else:
+                spans.append((start, end))
         
+        chunks = []
+        for start, end in spans:
+            chunk = text[start:end]
+            stripped = chunk.lstrip()
+            if stripped.strip():
+                chunks.append((stripped.rstrip(), start + len(chunk) - len(stripped)))
         return chunks
     
+    @staticmethod
+    def _split_spans(text: str, start: int, end: int, separator) -> List[Tuple[int, int]]:
+        """Return the (start, end) spans of text[start:end] between separator matches."""
+        spans = []
+        pos = start
+        for match in separator.finditer(text, start, end):
+            spans.append((pos, match.start()))
+            pos = match.end()
+        spans.append((pos, end))
+        return spans
+    
     def _categorize_errors(self, matches) -> Tuple[Dict[str, int], List[int], List[Dict]]:
         """
         Categorize grammar and spelling errors.
@@ -163,20 +214,7 @@ class GrammarSpellingEvaluator(ResumeEvaluator):
         detailed_errors = []
         
         for match in matches:
-            category = 'other'
-            msg = match.message.lower()
-            rule = match.ruleId.lower()
-            
-            # Explicitly check for spelling errors first
-            if 'spell' in rule or 'typo' in rule or 'misspell' in msg or 'unknown word' in msg:
-                category = 'spelling'
-            else:
-                # Find matching category
-                for cat, keywords in GRAMMAR_CATEGORY_RULES.items():
-                    if any(kw in msg or kw in rule for kw in keywords):
-                        category = cat
-                        break
-                    
+            category = _error_category(match.ruleId.lower(), match.message.lower())
             error_counts[category] += 1
             error_positions.append(match.offset)
             
@@ -220,12 +258,8 @@ class GrammarSpellingEvaluator(ResumeEvaluator):
         if len(error_positions) < 2:
             return 0
         
-        error_positions.sort()
-        total_distance = 0
-        for i in range(1, len(error_positions)):
-            total_distance += max(1, abs(error_positions[i] - error_positions[i-1]))
-        
-        avg_distance = total_distance / (len(error_positions) - 1)
+        positions = np.sort(np.asarray(error_positions, dtype=np.int64))
+        avg_distance = float(np.maximum(np.diff(positions), 1).mean())
         
         if avg_distance < GRAMMAR_PROXIMITY_PENALTY['critical_distance']:
             penalty = (GRAMMAR_PROXIMITY_PENALTY['critical_distance'] - avg_distance) \
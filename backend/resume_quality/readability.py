@@ -1,4 +1,3 @@
-import textstat
 from typing import Dict, Any
 from .evaluator_base import ResumeEvaluator
 from .config import READABILITY_WEIGHTS, READABILITY_THRESHOLDS, READABILITY_PENALTIES
@@ -8,6 +7,8 @@ class ReadabilityEvaluator(ResumeEvaluator):
     
     def evaluate(self, text: str) -> Dict[str, Any]:
         try:
+            import textstat
+            
             # Calculate all readability scores
             scores = {
                 'flesch_ease': textstat.flesch_reading_ease(text),
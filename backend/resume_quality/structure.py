@@ -4,30 +4,55 @@ from collections import defaultdict
 from .evaluator_base import ResumeEvaluator
 from .config import STRUCTURE_ESSENTIALS, STRUCTURE_PENALTIES, STRUCTURE_IDEAL_ORDER
 
+# Common section heading patterns, compiled once
+_SECTION_PATTERNS = {
+    'contact': re.compile(r'\b(?:contact|contact info|personal info|address|phone|email)\b', re.IGNORECASE),
+    'summary': re.compile(r'\b(?:summary|profile|objective|about me|professional summary)\b', re.IGNORECASE),
+    'experience': re.compile(r'\b(?:experience|employment|work history|professional experience|career)\b', re.IGNORECASE),
+    'education': re.compile(r'\b(?:education|academic|degree|university|school|college)\b', re.IGNORECASE),
+    'skills': re.compile(r'\b(?:skills|technical skills|core competencies|expertise|qualifications)\b', re.IGNORECASE),
+    'projects': re.compile(r'\b(?:projects|portfolio|works|case studies)\b', re.IGNORECASE),
+    'certifications': re.compile(r'\b(?:certifications|certificates|licenses|credentials)\b', re.IGNORECASE),
+    'awards': re.compile(r'\b(?:awards|honors|achievements|recognitions)\b', re.IGNORECASE),
+    'publications': re.compile(r'\b(?:publications|papers|articles|research|presentations)\b', re.IGNORECASE),
+    'languages': re.compile(r'\b(?:languages|language skills)\b', re.IGNORECASE),
+    'volunteer': re.compile(r'\b(?:volunteer|community service|activities)\b', re.IGNORECASE),
+    'interests': re.compile(r'\b(?:interests|hobbies|activities|personal)\b', re.IGNORECASE),
+    'references': re.compile(r'\b(?:references|referees)\b', re.IGNORECASE)
+}
+
+# All section patterns in one alternation, for "does any section match"
+_ANY_SECTION_RE = re.compile(
+    '|'.join(pattern.pattern for pattern in _SECTION_PATTERNS.values()), re.IGNORECASE
+)
+
+# Zero-width named groups: every position reports the first section (in
+# _SECTION_PATTERNS order) matching there, so the lowest-ranked hit across the
+# heading is the same section the ordered per-pattern search would pick
+_SECTION_TYPE_RE = re.compile(
+    '|'.join(f'(?=(?P<{section}>{pattern.pattern}))' for section, pattern in _SECTION_PATTERNS.items()),
+    re.IGNORECASE
+)
+_SECTION_RANK = {section: rank for rank, section in enumerate(_SECTION_PATTERNS)}
+
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_PHONE_RE = re.compile(r'[\d\-\+\(\)\s]{10,}')
+_DEGREE_RE = re.compile(r'\b(?:degree|bachelor|master|phd|diploma|certificate)\b', re.IGNORECASE)
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+_COMPANY_RE = re.compile(r'[A-Z][a-z]+ (?:Inc|LLC|Ltd|Co|Corporation|Company)')
+_SKILL_TOKEN_RE = re.compile(r'\b[A-Za-z][A-Za-z+#.]{2,}\b')
+
 class StructureEvaluator(ResumeEvaluator):
     """Evaluates the structural organization of a resume."""
     
     def __init__(self):
         """Initialize the structure evaluator."""
         # Define common section patterns
-        self.section_patterns = {
-            'contact': r'\b(?:contact|contact info|personal info|address|phone|email)\b',
-            'summary': r'\b(?:summary|profile|objective|about me|professional summary)\b',
-            'experience': r'\b(?:experience|employment|work history|professional experience|career)\b',
-            'education': r'\b(?:education|academic|degree|university|school|college)\b',
-            'skills': r'\b(?:skills|technical skills|core competencies|expertise|qualifications)\b',
-            'projects': r'\b(?:projects|portfolio|works|case studies)\b',
-            'certifications': r'\b(?:certifications|certificates|licenses|credentials)\b',
-            'awards': r'\b(?:awards|honors|achievements|recognitions)\b',
-            'publications': r'\b(?:publications|papers|articles|research|presentations)\b',
-            'languages': r'\b(?:languages|language skills)\b',
-            'volunteer': r'\b(?:volunteer|community service|activities)\b',
-            'interests': r'\b(?:interests|hobbies|activities|personal)\b',
-            'references': r'\b(?:references|referees)\b'
-        }
+        self.section_patterns = _SECTION_PATTERNS
         
         # Define ideal section order
         self.ideal_order = STRUCTURE_IDEAL_ORDER
+        self._ideal_index_map = {section: i for i, section in enumerate(self.ideal_order)}
         
         # Define essential sections
         self.essential_sections = [k for k, v in STRUCTURE_ESSENTIALS.items() if v > 0]
@@ -150,21 +175,18 @@ class StructureEvaluator(ResumeEvaluator):
             return True
             
         # Check if line matches any section pattern
-        for pattern in self.section_patterns.values():
-            if re.search(pattern, line, re.IGNORECASE):
-                return True
-                
-        return False
+        return bool(_ANY_SECTION_RE.search(line))
     
     def _identify_section_type(self, heading: str) -> str:
         """Identify section type from heading text."""
         heading_lower = heading.lower()
         
-        for section_type, pattern in self.section_patterns.items():
-            if re.search(pattern, heading_lower, re.IGNORECASE):
-                return section_type
-                
-        return 'unknown'
+        section_type = min(
+            (match.lastgroup for match in _SECTION_TYPE_RE.finditer(heading_lower)),
+            key=_SECTION_RANK.__getitem__,
+            default=None
+        )
+        return section_type or 'unknown'
     
     def _analyze_heading_format(self, heading: str) -> Dict[str, Any]:
         """Analyze the formatting of a section heading."""
@@ -187,55 +209,62 @@ class StructureEvaluator(ResumeEvaluator):
         if not sections:
             return STRUCTURE_PENALTIES['max_order_penalty']
             
-        # Create a map of actual section positions
-        actual_order = {}
-        for section_type, details in sections.items():
-            actual_order[section_type] = details['line_index']
-        
-        # Sort sections by their line index
-        sorted_sections = sorted(actual_order.items(), key=lambda x: x[1])
-        actual_section_types = [s[0] for s in sorted_sections]
-        
-        # Calculate order violations
-        violations = 0
-        for i, section_type in enumerate(actual_section_types):
-            ideal_idx = self._get_ideal_index(section_type)
-            for j, other_type in enumerate(actual_section_types[i+1:], i+1):
-                other_ideal_idx = self._get_ideal_index(other_type)
-                if ideal_idx > other_ideal_idx:
-                    violations += 1
+        # Order violations are inversions of the ideal indices in document order
+        ideal_indices = [self._get_ideal_index(t) for t in self._sorted_section_types(sections)]
+        violations = self._count_inversions(ideal_indices)
         
         # Calculate penalty based on violations
         return min(STRUCTURE_PENALTIES['max_order_penalty'], violations * 5)
     
     def _get_ideal_index(self, section_type: str) -> int:
         """Get the ideal index for a section type."""
-        try:
-            return self.ideal_order.index(section_type)
-        except ValueError:
-            # For unknown section types, place them at the end
-            return len(self.ideal_order)
+        # For unknown section types, place them at the end
+        return self._ideal_index_map.get(section_type, len(self.ideal_order))
+    
+    def _sorted_section_types(self, sections: Dict[str, Dict[str, Any]]) -> List[str]:
+        """Return section types in the order they appear in the resume."""
+        return sorted(sections, key=lambda section_type: sections[section_type]['line_index'])
+    
+    @staticmethod
+    def _count_inversions(values: List[int]) -> int:
+        """Count pairs i < j with values[i] > values[j] using merge sort."""
+        def sort_count(items):
+            if len(items) < 2:
+                return items, 0
+            mid = len(items) // 2
+            left, left_count = sort_count(items[:mid])
+            right, right_count = sort_count(items[mid:])
+            merged = []
+            count = left_count + right_count
+            i = j = 0
+            while i < len(left) and j < len(right):
+                if right[j] < left[i]:
+                    # right[j] is smaller than everything left in `left`
+                    merged.append(right[j])
+                    count += len(left) - i
+                    j += 1
+                else:
+                    merged.append(left[i])
+                    i += 1
+            merged.extend(left[i:])
+            merged.extend(right[j:])
+            return merged, count
+        
+        return sort_count(values)[1]
     
     def _get_order_details(self, sections: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """Get detailed information about section ordering."""
         if not sections:
             return {'status': 'no_sections'}
             
-        # Create a map of actual section positions
-        actual_order = {}
-        for section_type, details in sections.items():
-            actual_order[section_type] = details['line_index']
-        
-        # Sort sections by their line index
-        sorted_sections = sorted(actual_order.items(), key=lambda x: x[1])
-        actual_section_types = [s[0] for s in sorted_sections]
+        actual_section_types = self._sorted_section_types(sections)
+        ideal_indices = [self._get_ideal_index(t) for t in actual_section_types]
         
         # Find section order issues
         issues = []
         for i, section_type in enumerate(actual_section_types):
-            ideal_idx = self._get_ideal_index(section_type)
-            for j, other_type in enumerate(actual_section_types[i+1:], i+1):
-                other_ideal_idx = self._get_ideal_index(other_type)
+            ideal_idx = ideal_indices[i]
+            for other_type, other_ideal_idx in zip(actual_section_types[i+1:], ideal_indices[i+1:]):
                 if ideal_idx > other_ideal_idx:
                     issues.append({
                         'swap': f"{section_type} should come after {other_type}"
@@ -257,8 +286,8 @@ class StructureEvaluator(ResumeEvaluator):
         # Contact section checks
         if 'contact' in sections:
             contact_text = sections['contact']['content']
-            has_email = bool(re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', contact_text))
-            has_phone = bool(re.search(r'[\d\-\+\(\)\s]{10,}', contact_text))
+            has_email = bool(_EMAIL_RE.search(contact_text))
+            has_phone = bool(_PHONE_RE.search(contact_text))
             
             completeness_score += 5 if has_email else 0
             completeness_score += 5 if has_phone else 0
@@ -266,8 +295,8 @@ class StructureEvaluator(ResumeEvaluator):
         # Education section checks
         if 'education' in sections:
             education_text = sections['education']['content']
-            has_degree = bool(re.search(r'\b(?:degree|bachelor|master|phd|diploma|certificate)\b', education_text, re.IGNORECASE))
-            has_dates = bool(re.search(r'\b(?:19|20)\d{2}\b', education_text))
+            has_degree = bool(_DEGREE_RE.search(education_text))
+            has_dates = bool(_YEAR_RE.search(education_text))
             
             completeness_score += 5 if has_degree else 0
             completeness_score += 2 if has_dates else 0
@@ -275,8 +304,8 @@ class StructureEvaluator(ResumeEvaluator):
         # Experience section checks
         if 'experience' in sections:
             experience_text = sections['experience']['content']
-            has_company = bool(re.search(r'[A-Z][a-z]+ (?:Inc|LLC|Ltd|Co|Corporation|Company)', experience_text))
-            has_dates = bool(re.search(r'\b(?:19|20)\d{2}\b', experience_text))
+            has_company = bool(_COMPANY_RE.search(experience_text))
+            has_dates = bool(_YEAR_RE.search(experience_text))
             has_bullets = experience_text.count('\n') > 3 and any(line.strip().startswith(('•', '-', '*')) for line in experience_text.split('\n'))
             
             completeness_score += 3 if has_company else 0
@@ -286,7 +315,7 @@ class StructureEvaluator(ResumeEvaluator):
         # Skills section checks
         if 'skills' in sections:
             skills_text = sections['skills']['content']
-            skills_count = len(re.findall(r'\b[A-Za-z][A-Za-z+#.]{2,}\b', skills_text))
+            skills_count = len(_SKILL_TOKEN_RE.findall(skills_text))
             
             completeness_score += min(3, skills_count // 5)  # Up to 3 points based on skills count
         
@@ -1,17 +1,33 @@
-import spacy
 import re
 from datetime import datetime
 from typing import Dict, Any, List, Tuple, Optional
 from dateutil.parser import parse, ParserError
 from collections import defaultdict
-from .evaluator_base import ResumeEvaluator
+from .evaluator_base import ResumeEvaluator, load_spacy_model
 from .config import TIMELINE_MAX_GAP_DAYS, TIMELINE_PENALTY_WEIGHTS
+from backend.utils.dates import parse_month_year_fast
+
+# Tense detection reads POS, tags and morphology only. These components are
+# skipped per call; the shared pipeline itself stays intact for ActionVerbEvaluator
+_UNUSED_PIPES = ["parser", "lemmatizer"]
+
+_MONTHS = (
+    r'Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|'
+    r'January|February|March|April|May|June|July|August|September|October|November|December'
+)
+_DATE_RANGE_RE = re.compile(
+    rf'\b((?:{_MONTHS})[\s\.]+ \d{{4}})\s*[-–]\s*((?:{_MONTHS})[\s\.]+ \d{{4}}|[Pp]resent|[Cc]urrent)\b'
+)
+_DATE_CLEAN_RE = re.compile(r'[^\w\s–—/-]')
+_DATE_SPLIT_RE = re.compile(r'\s*(?:–|—|-|to|through|until)\s*')
+_PRESENT_RE = re.compile(r'\b(?:present|current)\b', re.IGNORECASE)
 
 class TenseTimelineEvaluator(ResumeEvaluator):
     """Evaluates tense consistency and timeline coherence in resumes."""
     
     def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
+        # Same pipeline instance as ActionVerbEvaluator, loaded once
+        self.nlp = load_spacy_model("en_core_web_sm")
         # Common irregular past tense verbs
         self.irregular_past_tense = {
             'ran', 'spoke', 'wrote', 'ate', 'drank', 'drove', 'broke',
@@ -79,19 +95,20 @@ class TenseTimelineEvaluator(ResumeEvaluator):
                             "to": current['raw_dates']
                         })
 
-            # Tense consistency check
-            for role in parsed_roles:
+            # Tense consistency check, tagging every bullet in one batch
+            bullet_refs = [(role, bullet) for role in parsed_roles for bullet in role['bullets']]
+            docs = self.nlp.pipe((bullet for _, bullet in bullet_refs), batch_size=64, disable=_UNUSED_PIPES)
+            for (role, bullet), doc in zip(bullet_refs, docs):
                 expected_tense = 'present' if role['end'] is None else 'past'
-                for bullet in role['bullets']:
-                    tense_errors = self._check_tense_consistency(bullet, expected_tense)
-                    if tense_errors:
-                        issues['tense_errors'].extend([{
-                            "text": bullet,
-                            "role": role['raw_dates'],
-                            "token": e['token'],
-                            "expected": expected_tense,
-                            "detected": e['detected']
-                        } for e in tense_errors])
+                tense_errors = self._check_tense_consistency(doc, expected_tense)
+                if tense_errors:
+                    issues['tense_errors'].extend([{
+                        "text": bullet,
+                        "role": role['raw_dates'],
+                        "token": e['token'],
+                        "expected": expected_tense,
+                        "detected": e['detected']
+                    } for e in tense_errors])
             
             # Calculate penalties
             penalties = {
@@ -124,9 +141,7 @@ class TenseTimelineEvaluator(ResumeEvaluator):
         experience_sections = []
         
         # Find potential date ranges
-        date_pattern = r'\b((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)[\s\.]+ \d{4})\s*[-–]\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|December|January|February|March|April|May|June|July|August|September|October|November|December)[\s\.]+ \d{4}|[Pp]resent|[Cc]urrent)\b'
-        
-        date_matches = list(re.finditer(date_pattern, text))
+        date_matches = list(_DATE_RANGE_RE.finditer(text))
         
         for i, match in enumerate(date_matches):
             date_range = match.group(0)
@@ -155,12 +170,12 @@ class TenseTimelineEvaluator(ResumeEvaluator):
         
         try:
             # Clean up and normalize
-            cleaned = re.sub(r'[^\w\s–—/-]', '', date_range.strip())
-            parts = re.split(r'\s*(?:–|—|-|to|through|until)\s*', cleaned, maxsplit=1)
+            cleaned = _DATE_CLEAN_RE.sub('', date_range.strip())
+            parts = _DATE_SPLIT_RE.split(cleaned, maxsplit=1)
             
             start = self._parse_single_date(parts[0].strip()) if parts[0] else None
             end = None if len(parts) < 2 else (
-                None if re.search(r'\b(?:present|current)\b', parts[1], re.IGNORECASE) 
+                None if _PRESENT_RE.search(parts[1]) 
                 else self._parse_single_date(parts[1].strip())
             )
             
@@ -171,16 +186,19 @@ class TenseTimelineEvaluator(ResumeEvaluator):
     def _parse_single_date(self, date_str: str) -> datetime.date:
         """Parse an individual date string to a date object."""
         try:
-            if re.search(r'\b(?:present|current)\b', date_str, re.IGNORECASE):
+            if _PRESENT_RE.search(date_str):
                 return None
+            # "<Month> <YYYY>" covers nearly every resume date; dateutil handles the rest
+            fast = parse_month_year_fast(date_str)
+            if fast:
+                return fast.date()
             return parse(date_str, fuzzy=True).date()
         except (ParserError, ValueError) as e:
             raise ValueError(f"Failed to parse date: {date_str}")
     
-    def _check_tense_consistency(self, bullet: str, expected_tense: str) -> List[Dict[str, Any]]:
-        """Check if verbs in a bullet point are in the expected tense."""
+    def _check_tense_consistency(self, doc, expected_tense: str) -> List[Dict[str, Any]]:
+        """Check if verbs in a processed bullet point are in the expected tense."""
         errors = []
-        doc = self.nlp(bullet)
         
         for token in doc:
             if token.pos_ == 'VERB':
@@ -1,4 +1,29 @@
-from transformers import BertTokenizer, BertModel
+import threading
 
-tokenizer = BertTokenizer.from_pretrained("bert-base-uncased")
-model = BertModel.from_pretrained("bert-base-uncased")
+_bert = None
+_bert_lock = threading.Lock()
+
+def get_bert():
+    """Load the BERT tokenizer and model on first use."""
+    global _bert
+    if _bert is None:
+        with _bert_lock:  # Concurrent first requests load the model only once
+            if _bert is None:
+                _bert = _load_bert()
+    return _bert
+
+def _load_bert():
+    import torch
+    from transformers import BertTokenizer, BertModel
+
+    tokenizer = BertTokenizer.from_pretrained("bert-base-uncased")
+    model = BertModel.from_pretrained("bert-base-uncased")
+    model.eval()
+
+    if torch.cuda.is_available():
+        # fp16 weights on the GPU; dynamic quantization is CPU-only.
+        model = model.to("cuda").half()
+    else:
+        # int8 weights for the Linear layers on CPU.
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return tokenizer, model
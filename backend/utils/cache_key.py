@@ -0,0 +1,8 @@
+import hashlib
+
+def text_cache_key(text):
+    """Key a text for an in-process cache."""
+    # Short texts are cheaper to use as their own key than to hash
+    if len(text) < 256:
+        return text
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
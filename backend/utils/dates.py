@@ -0,0 +1,16 @@
+import calendar
+from datetime import datetime
+
+# Full and abbreviated month names (plus "sept") to month numbers
+MONTH_NUMBERS = {name.lower(): i for i, name in enumerate(calendar.month_name) if name}
+MONTH_NUMBERS.update({name.lower(): i for i, name in enumerate(calendar.month_abbr) if name})
+MONTH_NUMBERS["sept"] = 9
+
+def parse_month_year_fast(date_str):
+    """Parse "<Month> <YYYY>" (e.g. "Jan 2020", "Sept. 2019") to the 1st of that month, else None."""
+    parts = date_str.split()
+    if len(parts) == 2 and parts[1].isdigit() and int(parts[1]) > 0:
+        month = MONTH_NUMBERS.get(parts[0].lower().rstrip("."))
+        if month:
+            return datetime(int(parts[1]), month, 1)
+    return None
@@ -1,3 +1,27 @@
-import spacy
+import os
+import threading
 
-nlp = spacy.load("en_core_web_lg")
+# en_core_web_sm can be swapped in where memory matters more than NER accuracy.
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_lg")
+
+_models = {}
+_models_lock = threading.Lock()
+
+def load_model(model_name, exclude=()):
+    """Load a spaCy pipeline once per (model, excluded components) and share it."""
+    key = (model_name, tuple(exclude))
+    nlp = _models.get(key)
+    if nlp is None:
+        with _models_lock:  # Concurrent first requests load the model only once
+            nlp = _models.get(key)
+            if nlp is None:
+                import spacy
+
+                nlp = _models[key] = spacy.load(model_name, exclude=list(exclude))
+    return nlp
+
+def get_nlp():
+    """Load the shared spaCy pipeline on first use."""
+    # Callers only need POS tags (skills) and entities (locations), so the
+    # dependency parser and lemmatizer are never loaded.
+    return load_model(SPACY_MODEL, ("parser", "lemmatizer"))
@@ -0,0 +1,12 @@
+ALTER TABLE resumes ADD COLUMN file_hash VARCHAR(40);
+
+CREATE INDEX ix_resumes_file_hash ON resumes (file_hash);
+
+CREATE TABLE score_cache (
+    id SERIAL PRIMARY KEY,
+    resume_hash VARCHAR(40) NOT NULL,
+    job_hash VARCHAR(40) NOT NULL,
+    model_version VARCHAR NOT NULL,
+    scores JSON NOT NULL,
+    UNIQUE (resume_hash, job_hash, model_version)
+);